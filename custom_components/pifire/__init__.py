@@ -2,25 +2,99 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
 from datetime import timedelta
+from typing import Any
+
+import aiohttp
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DOMAIN, PLATFORMS, CONF_HOST
-from .pifire_client import PiFireClient
+from .const import DOMAIN, EMPTY_MAPPING, PLATFORMS, CONF_HOST
+from .pifire_client import PiFireClient, PiFireError
 
 _LOGGER = logging.getLogger(__name__)
 
 # Define update intervals
 FAST_UPDATE_INTERVAL = timedelta(seconds=5)
+MEDIUM_UPDATE_INTERVAL = timedelta(seconds=10)
 SLOW_UPDATE_INTERVAL = timedelta(seconds=30)
+IDLE_UPDATE_INTERVAL = timedelta(seconds=60)
 
 # Modes that require fast updates
-FAST_UPDATE_MODES = {"startup", "smoke", "monitor", "hold"}
+FAST_UPDATE_MODES = frozenset({"startup", "smoke", "monitor", "hold"})
+
+# Transitional modes that use the medium update interval
+MEDIUM_UPDATE_MODES = frozenset({"shutdown", "prime", "recipe"})
+
+# Seconds in stop mode before dropping to the idle update interval
+IDLE_AFTER_STOP_SECONDS = 300
+
+# Pellet level changes slowly, so only poll the hopper every N-th update
+HOPPER_UPDATE_EVERY = 6
+
+
+def _as_mapping(value: Any) -> Mapping[str, Any]:
+    """Return value if it is a mapping, otherwise a shared empty mapping."""
+    return value if isinstance(value, Mapping) else EMPTY_MAPPING
+
+
+@dataclass(slots=True)
+class PiFireView:
+    """Pre-resolved sections of a PiFire payload shared by entities."""
+
+    status: Mapping[str, Any]
+    current: Mapping[str, Any]
+    outpins: Mapping[str, Any]
+    pmap: Mapping[str, Any]
+    ftemps: Mapping[str, Any]
+    nt: Mapping[str, Any]
+    hopper: Mapping[str, Any]
+    mode: str
+    probe_index: dict[str, Any]
+    bluetooth_labels: frozenset[str]
+
+    @classmethod
+    def from_data(cls, data: dict[str, Any] | None) -> PiFireView:
+        """Build a view from coordinator data."""
+        data = _as_mapping(data)
+        status = _as_mapping(data.get("status"))
+        current = _as_mapping(data.get("current"))
+
+        # Map each probe label to its probe_status metadata (first group wins)
+        probe_index: dict[str, Any] = {}
+        probe_status = _as_mapping(status.get("probe_status"))
+        for group_key in ("P", "F", "AUX"):
+            for label, meta in _as_mapping(probe_status.get(group_key)).items():
+                probe_index.setdefault(label, meta)
+
+        # Labels of thermostats connected over Bluetooth
+        bluetooth_labels: set[str] = set()
+        for thermostat in _as_mapping(data.get("thermostats")).values():
+            if isinstance(thermostat, Mapping):
+                conn = str(thermostat.get("type") or "").lower()
+                if "bluetooth" in conn or "bt" in conn:
+                    bluetooth_labels.add(thermostat.get("label", ""))
+
+        return cls(
+            status=status,
+            current=current,
+            outpins=_as_mapping(status.get("outpins")),
+            pmap=_as_mapping(current.get("P")),
+            ftemps=_as_mapping(current.get("F")),
+            nt=_as_mapping(current.get("NT")),
+            hopper=_as_mapping(data.get("hopper")),
+            mode=str(status.get("mode") or "").lower(),
+            probe_index=probe_index,
+            bluetooth_labels=frozenset(bluetooth_labels),
+        )
 
 
 class PiFireDataUpdateCoordinator(DataUpdateCoordinator):
@@ -30,6 +104,10 @@ class PiFireDataUpdateCoordinator(DataUpdateCoordinator):
         """Initialize the coordinator."""
         self.client = client
         self._entry = entry
+        self._hopper_tick = 0
+        self._stop_since: float | None = None
+        self._last_mode: str | None = None
+        self.view = PiFireView.from_data(None)
         super().__init__(
             hass,
             _LOGGER,
@@ -37,47 +115,90 @@ class PiFireDataUpdateCoordinator(DataUpdateCoordinator):
             update_method=self._async_update_data,
             update_interval=SLOW_UPDATE_INTERVAL,  # Start with slow interval
             config_entry=entry,
+            # Skip listener callbacks when a poll returns an identical payload
+            always_update=False,
         )
 
     async def _async_update_data(self):
         """Update coordinator data and adjust update interval based on mode."""
         try:
-            # Get both current status and hopper data
-            current_data = await self.client.get_current()
-            hopper_data = await self.client.get_hopper_data()
+            if self._hopper_tick % HOPPER_UPDATE_EVERY == 0:
+                # Get current status and hopper data concurrently
+                current_data, hopper_data = await self.client.get_all()
+            else:
+                # Reuse the hopper data from the previous cycle
+                current_data = await self.client.get_current()
+                hopper_data = (self.data or {}).get("hopper")
+            self._hopper_tick += 1
 
-            # Combine the data
-            combined_data = current_data.copy()
+            # Combine the data; get_current returns a freshly decoded dict
             if hopper_data:
-                combined_data["hopper"] = hopper_data
+                current_data["hopper"] = hopper_data
 
-            # Check current mode and adjust update interval
-            self._adjust_update_interval(combined_data)
+            # Build the shared view, then adjust the update interval for its mode
+            self.view = PiFireView.from_data(current_data)
+            self._adjust_update_interval(self.view.mode)
 
-            return combined_data
-        except Exception as err:
+            return current_data
+        except (PiFireError, aiohttp.ClientError, asyncio.TimeoutError) as err:
             raise UpdateFailed(f"Error communicating with API: {err}") from err
 
-    def _adjust_update_interval(self, data: dict) -> None:
+    async def async_burst_refresh(self, count: int = 3, spacing: float = 1.5) -> None:
+        """Refresh now, then poll a few more times while a command settles."""
+        await self.async_request_refresh()
+        # Follow-up polls run in the background and are cancelled on unload
+        self._entry.async_create_background_task(
+            self.hass,
+            self._async_follow_up_refresh(count, spacing),
+            "pifire follow-up refresh",
+        )
+
+    async def _async_follow_up_refresh(self, count: int, spacing: float) -> None:
+        """Poll directly, bypassing the request debouncer's cooldown."""
+        for _ in range(count):
+            await asyncio.sleep(spacing)
+            await self.async_refresh()
+
+    def _adjust_update_interval(self, current_mode: str) -> None:
         """Adjust update interval based on current PiFire mode."""
         try:
-            status = data.get("status", {})
-            current_mode = status.get("mode", "").lower()
+            # Nothing to do while the mode is unchanged, except in stop mode
+            # where the interval still drops to idle after a while
+            if current_mode == self._last_mode and (
+                current_mode != "stop" or self.update_interval == IDLE_UPDATE_INTERVAL
+            ):
+                return
+            self._last_mode = current_mode
+
+            # Track how long the grill has been sitting in stop mode
+            now = time.monotonic()
+            if current_mode != "stop":
+                self._stop_since = None
+            elif self._stop_since is None:
+                self._stop_since = now
 
             # Determine required update interval
             if current_mode in FAST_UPDATE_MODES:
                 required_interval = FAST_UPDATE_INTERVAL
+            elif current_mode in MEDIUM_UPDATE_MODES:
+                required_interval = MEDIUM_UPDATE_INTERVAL
+            elif (
+                self._stop_since is not None
+                and now - self._stop_since > IDLE_AFTER_STOP_SECONDS
+            ):
+                required_interval = IDLE_UPDATE_INTERVAL
             else:
                 required_interval = SLOW_UPDATE_INTERVAL
 
             # Only change if different from current interval
             if self.update_interval != required_interval:
-                _LOGGER.debug(
-                    "Changing update interval from %s to %s (mode: %s)",
-                    self.update_interval,
-                    required_interval,
-                    current_mode,
-                )
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug(
+                        "Changing update interval from %s to %s (mode: %s)",
+                        self.update_interval,
+                        required_interval,
+                        current_mode,
+                    )
                 self.update_interval = required_interval
 
         except Exception as err:
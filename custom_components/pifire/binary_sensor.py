@@ -17,6 +17,19 @@ from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+# (pin name, friendly name, icon when off, icon when on)
+RELAYS = (
+    ("power", "Power Relay", "mdi:current-ac", "mdi:current-ac"),
+    ("fan", "Fan Relay", "mdi:fan", "mdi:fan-alert"),
+    (
+        "auger",
+        "Auger Relay",
+        "mdi:screw-machine-round-top",
+        "mdi:screw-machine-round-top",
+    ),
+    ("igniter", "Igniter Relay", "mdi:heating-coil", "mdi:heating-coil"),
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
@@ -27,17 +40,13 @@ async def async_setup_entry(
     device_info = data["device_info"]
 
     async_add_entities(
-        [
-            PiFirePowerRelaySensor(entry, coordinator, device_info),
-            PiFireFanRelaySensor(entry, coordinator, device_info),
-            PiFireAugerRelaySensor(entry, coordinator, device_info),
-            PiFireIgniterRelaySensor(entry, coordinator, device_info),
-        ]
+        PiFireOutputPinSensor(entry, coordinator, device_info, *relay)
+        for relay in RELAYS
     )
 
 
 class PiFireOutputPinSensor(BinarySensorEntity):
-    """Base class for PiFire output pin relay sensors."""
+    """Binary sensor for a PiFire output pin relay."""
 
     _attr_has_entity_name = True
     _attr_entity_category = EntityCategory.DIAGNOSTIC
@@ -61,6 +70,7 @@ class PiFireOutputPinSensor(BinarySensorEntity):
         self._attr_unique_id = f"{entry.entry_id}_{pin_name}_relay"
         self._icon_off = icon_off
         self._icon_on = icon_on
+        self._is_on = self._read_pin()
 
     async def async_added_to_hass(self) -> None:
         """Subscribe to coordinator updates."""
@@ -68,101 +78,30 @@ class PiFireOutputPinSensor(BinarySensorEntity):
             self.coordinator.async_add_listener(self._handle_coordinator_update)
         )
 
+    def _read_pin(self) -> bool | None:
+        """Read the output pin state from coordinator data."""
+        pin_state = self.coordinator.view.outpins.get(self._pin_name)
+        return bool(pin_state) if pin_state is not None else None
+
     @property
     def is_on(self) -> bool | None:
         """Return true if the output pin is active."""
-        data = self.coordinator.data or {}
-        status = data.get("status", {})
-        outpins = status.get("outpins", {})
-
-        pin_state = outpins.get(self._pin_name)
-        return bool(pin_state) if pin_state is not None else None
+        return self._is_on
 
     @property
     def state(self) -> str | None:
         """Return the state of the binary sensor."""
-        if self.is_on is None:
+        if self._is_on is None:
             return None
-        return "On" if self.is_on else "Off"
+        return "On" if self._is_on else "Off"
 
     @property
     def icon(self) -> str:
         """Return the icon to use in the frontend."""
-        return self._icon_on if self.is_on else self._icon_off
+        return self._icon_on if self._is_on else self._icon_off
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle coordinator update."""
+        self._is_on = self._read_pin()
         self.async_write_ha_state()
-
-
-class PiFirePowerRelaySensor(PiFireOutputPinSensor):
-    """Binary sensor for power relay status."""
-
-    def __init__(
-        self, entry: ConfigEntry, coordinator, device_info: DeviceInfo
-    ) -> None:
-        """Initialize the power relay sensor."""
-        super().__init__(
-            entry,
-            coordinator,
-            device_info,
-            "power",
-            "Power Relay",
-            "mdi:current-ac",
-            "mdi:current-ac",
-        )
-
-
-class PiFireFanRelaySensor(PiFireOutputPinSensor):
-    """Binary sensor for fan relay status."""
-
-    def __init__(
-        self, entry: ConfigEntry, coordinator, device_info: DeviceInfo
-    ) -> None:
-        """Initialize the fan relay sensor."""
-        super().__init__(
-            entry,
-            coordinator,
-            device_info,
-            "fan",
-            "Fan Relay",
-            "mdi:fan",
-            "mdi:fan-alert",
-        )
-
-
-class PiFireAugerRelaySensor(PiFireOutputPinSensor):
-    """Binary sensor for auger relay status."""
-
-    def __init__(
-        self, entry: ConfigEntry, coordinator, device_info: DeviceInfo
-    ) -> None:
-        """Initialize the auger relay sensor."""
-        super().__init__(
-            entry,
-            coordinator,
-            device_info,
-            "auger",
-            "Auger Relay",
-            "mdi:screw-machine-round-top",
-            "mdi:screw-machine-round-top",
-        )
-
-
-class PiFireIgniterRelaySensor(PiFireOutputPinSensor):
-    """Binary sensor for igniter relay status."""
-
-    def __init__(
-        self, entry: ConfigEntry, coordinator, device_info: DeviceInfo
-    ) -> None:
-        """Initialize the igniter relay sensor."""
-        super().__init__(
-            entry,
-            coordinator,
-            device_info,
-            "igniter",
-            "Igniter Relay",
-            "mdi:heating-coil",
-            "mdi:heating-coil",
-        )
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from types import MappingProxyType
 
 import aiohttp
 
@@ -10,22 +12,23 @@ from homeassistant.components.button import ButtonDeviceClass, ButtonEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.entity import DeviceInfo, EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.entity_registry import async_get
 
 from .const import DOMAIN
+from .pifire_client import PiFireError
 
 _LOGGER = logging.getLogger(__name__)
 
 # Map display names to API values for prime next mode
-DISPLAY_TO_API = {
-    "Stop": "stop",
-    "Startup": "startup",
-    "Smoke": "smoke",
-    "Hold": "hold",
-}
+DISPLAY_TO_API = MappingProxyType(
+    {
+        "Stop": "stop",
+        "Startup": "startup",
+        "Smoke": "smoke",
+        "Hold": "hold",
+    }
+)
 
 
 async def async_setup_entry(
@@ -75,27 +78,9 @@ class PiFireSystemButton(ButtonEntity):
     async def async_press(self) -> None:
         """Handle the button press."""
         try:
-            # Use direct API call with correct endpoint
-            host = self._entry.data.get("host", "localhost")
-            port = self._entry.data.get("port", 80)
-            base_url = f"http://{host}:{port}"
-            url = f"{base_url}{self._endpoint}"
-
-            session = async_get_clientsession(self.hass)
-            async with session.post(url) as response:
-                if response.status not in (200, 201):
-                    response_text = await response.text()
-                    raise HomeAssistantError(
-                        f"API returned {response.status}: {response_text}"
-                    )
-
+            await self.client.send_command(self._endpoint)
             _LOGGER.info("Successfully executed %s command", self._attr_name)
-        except aiohttp.ClientError as err:
-            _LOGGER.error("Failed to execute %s command: %s", self._attr_name, err)
-            raise HomeAssistantError(
-                f"Failed to execute {self._attr_name} command"
-            ) from err
-        except Exception as err:
+        except (PiFireError, aiohttp.ClientError, asyncio.TimeoutError) as err:
             _LOGGER.error("Failed to execute %s command: %s", self._attr_name, err)
             raise HomeAssistantError(
                 f"Failed to execute {self._attr_name} command"
@@ -172,29 +157,29 @@ class PiFirePrimePelletsButton(ButtonEntity):
         self._attr_device_info = device_info
         self._attr_unique_id = f"{entry.entry_id}_prime_pellets"
 
+    def _read_state(self, entity_id: str) -> str | None:
+        """Return an entity's state, or None if it is missing or unavailable."""
+        state = self.hass.states.get(entity_id)
+        if state is None or state.state in ("unknown", "unavailable"):
+            return None
+        return state.state
+
     async def async_press(self) -> None:
         """Handle the prime pellets button press."""
         try:
             # Get the grams value from the number entity
-            entity_registry = async_get(self.hass)
-            grams_entity_id = "number.pifire_prime_pellets_grams"
-
-            # Try to get the entity state
-            grams_state = self.hass.states.get(grams_entity_id)
-            if grams_state and grams_state.state not in ("unknown", "unavailable"):
+            grams = 100  # Default fallback
+            grams_state = self._read_state("number.pifire_prime_pellets_grams")
+            if grams_state is not None:
                 try:
-                    grams = int(float(grams_state.state))
+                    grams = int(float(grams_state))
                 except (ValueError, TypeError):
-                    grams = 100  # Default fallback
-            else:
-                grams = 100  # Default fallback
+                    pass
 
             # Get the current mode from the mode selector for next_mode
-            mode_entity_id = "select.pifire_mode"
-            mode_state = self.hass.states.get(mode_entity_id)
-            if mode_state and mode_state.state not in ("unknown", "unavailable"):
-                display_mode = mode_state.state
-                next_mode = DISPLAY_TO_API.get(display_mode, "stop")
+            mode_state = self._read_state("select.pifire_mode")
+            if mode_state is not None:
+                next_mode = DISPLAY_TO_API.get(mode_state, "stop")
             else:
                 next_mode = "stop"  # Default fallback
 
@@ -205,8 +190,8 @@ class PiFirePrimePelletsButton(ButtonEntity):
                 next_mode,
             )
 
-            # Trigger coordinator update
-            await self.coordinator.async_request_refresh()
-        except Exception as err:
+            # Trigger a burst of coordinator updates while the mode settles
+            await self.coordinator.async_burst_refresh()
+        except (PiFireError, aiohttp.ClientError, asyncio.TimeoutError) as err:
             _LOGGER.error("Failed to prime pellets: %s", err)
             raise HomeAssistantError("Failed to prime pellets") from err
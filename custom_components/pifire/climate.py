@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from types import MappingProxyType
 from typing import Any
 
+import aiohttp
+
 from homeassistant.components.climate import (
     ClimateEntity,
     ClimateEntityFeature,
@@ -19,6 +23,7 @@ from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
+from .pifire_client import PiFireError
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -28,19 +33,18 @@ PRESET_SMOKE = "smoke"
 PRESET_HOLD = "hold"
 
 # Map PiFire modes to presets
-PIFIRE_MODE_TO_PRESET = {
-    "startup": PRESET_STARTUP,
-    "smoke": PRESET_SMOKE,
-    "hold": PRESET_HOLD,
-    "stop": PRESET_NONE,
-}
+PIFIRE_MODE_TO_PRESET = MappingProxyType(
+    {
+        "startup": PRESET_STARTUP,
+        "smoke": PRESET_SMOKE,
+        "hold": PRESET_HOLD,
+        "stop": PRESET_NONE,
+    }
+)
 
-PRESET_TO_PIFIRE_MODE = {
-    PRESET_STARTUP: "startup",
-    PRESET_SMOKE: "smoke",
-    PRESET_HOLD: "hold",
-    PRESET_NONE: "stop",
-}
+PRESET_TO_PIFIRE_MODE = MappingProxyType(
+    {v: k for k, v in PIFIRE_MODE_TO_PRESET.items()}
+)
 
 
 async def async_setup_entry(
@@ -50,8 +54,9 @@ async def async_setup_entry(
     data = hass.data[DOMAIN][entry.entry_id]
     coordinator = data["coordinator"]
     client = data["client"]
+    device_info = data["device_info"]
 
-    async_add_entities([PiFireThermostat(entry, coordinator, client)])
+    async_add_entities([PiFireThermostat(entry, coordinator, client, device_info)])
 
 
 class PiFireThermostat(ClimateEntity):
@@ -71,12 +76,16 @@ class PiFireThermostat(ClimateEntity):
     _attr_max_temp = 500
     _attr_target_temperature_step = 1
 
-    def __init__(self, entry: ConfigEntry, coordinator, client) -> None:
+    def __init__(
+        self, entry: ConfigEntry, coordinator, client, device_info: DeviceInfo
+    ) -> None:
         """Initialize the thermostat."""
         self._entry = entry
         self.coordinator = coordinator
         self.client = client
+        self._attr_device_info = device_info
         self._attr_unique_id = f"{entry.entry_id}_thermostat"
+        self._refresh_cache()
 
     async def async_added_to_hass(self) -> None:
         """Subscribe to coordinator updates."""
@@ -84,112 +93,30 @@ class PiFireThermostat(ClimateEntity):
             self.coordinator.async_add_listener(self._handle_coordinator_update)
         )
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.entry_id)},
-            name="PiFire",
-            manufacturer="PiFire",
-            model="Grill Controller",
-        )
-
-    @property
-    def temperature_unit(self) -> str:
-        """Return the unit of measurement."""
-        data = self.coordinator.data or {}
-        status = data.get("status", {})
-        units = str(status.get("units", "")).upper()
-        return (
-            UnitOfTemperature.CELSIUS if units == "C" else UnitOfTemperature.FAHRENHEIT
-        )
-
-    @property
-    def min_temp(self) -> float:
-        """Return the minimum temperature."""
-        if self.temperature_unit == UnitOfTemperature.CELSIUS:
-            return 38  # ~100°F in Celsius
-        return 100  # 100°F
-
-    @property
-    def max_temp(self) -> float:
-        """Return the maximum temperature."""
-        if self.temperature_unit == UnitOfTemperature.CELSIUS:
-            return 260  # ~500°F in Celsius
-        return 500  # 500°F
-
     @property
     def current_temperature(self) -> float | None:
         """Return the current temperature."""
-        data = self.coordinator.data or {}
-        current = data.get("current", {})
-        pmap = current.get("P", {})
-
-        # Get grill temperature from P["Grill"]
-        grill_temp = pmap.get("Grill")
-        try:
-            return float(grill_temp) if grill_temp is not None else None
-        except (TypeError, ValueError):
-            return None
+        return self._cache["current"]
 
     @property
     def target_temperature(self) -> float | None:
         """Return the target temperature."""
-        data = self.coordinator.data or {}
-        current = data.get("current", {})
-
-        # Get setpoint from PSP (Primary Setpoint)
-        psp = current.get("PSP")
-        if psp is not None:
-            try:
-                return float(psp)
-            except (TypeError, ValueError):
-                pass
-
-        # Fallback to P.Grill setpoint
-        pmap = current.get("P", {})
-        setpoint = pmap.get("Grill")
-        try:
-            return float(setpoint) if setpoint is not None else None
-        except (TypeError, ValueError):
-            return None
+        return self._cache["target"]
 
     @property
     def hvac_mode(self) -> HVACMode:
         """Return current HVAC mode."""
-        data = self.coordinator.data or {}
-        status = data.get("status", {})
-        pifire_mode = status.get("mode", "").lower()
-
-        # Simple on/off based on stop mode
-        return HVACMode.OFF if pifire_mode == "stop" else HVACMode.HEAT
+        return self._cache["mode"]
 
     @property
     def preset_mode(self) -> str:
         """Return current preset mode."""
-        data = self.coordinator.data or {}
-        status = data.get("status", {})
-        pifire_mode = status.get("mode", "").lower()
-
-        return PIFIRE_MODE_TO_PRESET.get(pifire_mode, PRESET_NONE)
+        return self._cache["preset"]
 
     @property
     def hvac_action(self) -> str | None:
         """Return current HVAC action."""
-        data = self.coordinator.data or {}
-        status = data.get("status", {})
-        pifire_mode = status.get("mode", "").lower()
-
-        if pifire_mode == "stop":
-            return "off"
-        elif pifire_mode in ("startup", "smoke", "hold"):
-            # Check if we're actively heating by looking at fan/auger status
-            outpins = status.get("outpins", {})
-            if outpins.get("fan") or outpins.get("auger"):
-                return "heating"
-            return "idle"
-
-        return "off"
+        return self._cache["action"]
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new target hvac mode."""
@@ -205,9 +132,9 @@ class PiFireThermostat(ClimateEntity):
             else:
                 raise HomeAssistantError(f"Unsupported HVAC mode: {hvac_mode}")
 
-            # Trigger coordinator update
-            await self.coordinator.async_request_refresh()
-        except Exception as err:
+            # Trigger a burst of coordinator updates while the mode settles
+            await self.coordinator.async_burst_refresh()
+        except (PiFireError, aiohttp.ClientError, asyncio.TimeoutError) as err:
             _LOGGER.error("Failed to set HVAC mode to %s: %s", hvac_mode, err)
             raise HomeAssistantError(f"Failed to set mode to {hvac_mode}") from err
 
@@ -227,9 +154,9 @@ class PiFireThermostat(ClimateEntity):
                 await self.client.set_mode(pifire_mode)
                 _LOGGER.debug("Set PiFire mode to %s", pifire_mode)
 
-            # Trigger coordinator update
-            await self.coordinator.async_request_refresh()
-        except Exception as err:
+            # Trigger a burst of coordinator updates while the mode settles
+            await self.coordinator.async_burst_refresh()
+        except (PiFireError, aiohttp.ClientError, asyncio.TimeoutError) as err:
             _LOGGER.error("Failed to set preset mode to %s: %s", preset_mode, err)
             raise HomeAssistantError(f"Failed to set preset to {preset_mode}") from err
 
@@ -243,9 +170,9 @@ class PiFireThermostat(ClimateEntity):
             await self.client.set_hold_mode(temperature)
             _LOGGER.debug("Set PiFire temperature to %s°", temperature)
 
-            # Trigger coordinator update
-            await self.coordinator.async_request_refresh()
-        except Exception as err:
+            # Trigger a burst of coordinator updates while the mode settles
+            await self.coordinator.async_burst_refresh()
+        except (PiFireError, aiohttp.ClientError, asyncio.TimeoutError) as err:
             _LOGGER.error("Failed to set temperature to %s°: %s", temperature, err)
             raise HomeAssistantError(
                 f"Failed to set temperature to {temperature}°"
@@ -254,26 +181,76 @@ class PiFireThermostat(ClimateEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return additional state attributes."""
-        data = self.coordinator.data or {}
-        status = data.get("status", {})
+        return self._cache["attrs"]
+
+    def _refresh_cache(self) -> None:
+        """Derive all state values from one pass over the coordinator data."""
+        view = self.coordinator.view
+        status = view.status
+        current = view.current
+        pmap = view.pmap
+        outpins = view.outpins
+        pifire_mode = view.mode
+
+        units = str(status.get("units", "")).upper()
+        if units == "C":
+            self._attr_temperature_unit = UnitOfTemperature.CELSIUS
+            self._attr_min_temp = 38  # ~100°F in Celsius
+            self._attr_max_temp = 260  # ~500°F in Celsius
+        else:
+            self._attr_temperature_unit = UnitOfTemperature.FAHRENHEIT
+            self._attr_min_temp = 100
+            self._attr_max_temp = 500
+
+        # Get grill temperature from P["Grill"]
+        grill_temp = pmap.get("Grill")
+        try:
+            current_temp = float(grill_temp) if grill_temp is not None else None
+        except (TypeError, ValueError):
+            current_temp = None
+
+        # Get setpoint from PSP (Primary Setpoint), falling back to P.Grill
+        target_temp = None
+        psp = current.get("PSP")
+        if psp is not None:
+            try:
+                target_temp = float(psp)
+            except (TypeError, ValueError):
+                pass
+        if target_temp is None:
+            target_temp = current_temp
+
+        if pifire_mode in ("startup", "smoke", "hold"):
+            # Check if we're actively heating by looking at fan/auger status
+            action = "heating" if outpins.get("fan") or outpins.get("auger") else "idle"
+        else:
+            action = "off"
 
         attributes = {}
 
         # Add PiFire-specific mode
-        pifire_mode = status.get("mode")
-        if pifire_mode:
-            attributes["pifire_mode"] = pifire_mode
+        raw_mode = status.get("mode")
+        if raw_mode:
+            attributes["pifire_mode"] = raw_mode
 
         # Add output pin status
-        outpins = status.get("outpins", {})
         if outpins:
             attributes["fan"] = outpins.get("fan", False)
             attributes["auger"] = outpins.get("auger", False)
             attributes["igniter"] = outpins.get("igniter", False)
 
-        return attributes if attributes else None
+        self._cache = {
+            "current": current_temp,
+            "target": target_temp,
+            # Simple on/off based on stop mode
+            "mode": HVACMode.OFF if pifire_mode == "stop" else HVACMode.HEAT,
+            "preset": PIFIRE_MODE_TO_PRESET.get(pifire_mode, PRESET_NONE),
+            "action": action,
+            "attrs": attributes if attributes else None,
+        }
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle coordinator update."""
+        self._refresh_cache()
         self.async_write_ha_state()
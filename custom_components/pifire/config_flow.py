@@ -1,10 +1,11 @@
 from __future__ import annotations
+from typing import Final
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.data_entry_flow import FlowResult
 from .const import DOMAIN, CONF_HOST
 
-DATA_SCHEMA = vol.Schema({vol.Required(CONF_HOST, default="pifire.local"): str})
+DATA_SCHEMA: Final = vol.Schema({vol.Required(CONF_HOST, default="pifire.local"): str})
 
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -12,7 +13,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     async def async_step_user(self, user_input: dict | None = None) -> FlowResult:
         if user_input is not None:
-            host = user_input[CONF_HOST].strip()
+            host = str(user_input.get(CONF_HOST, "")).strip().removesuffix("/")
             unique = f"http://{host}"
             await self.async_set_unique_id(unique)
             self._abort_if_unique_id_configured()
@@ -2,16 +2,23 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, Final
+
 from homeassistant.const import Platform
 
-DOMAIN = "pifire"
-CONF_HOST = "host"
+DOMAIN: Final[str] = "pifire"
+CONF_HOST: Final[str] = "host"
 
-PLATFORMS: list[Platform] = [
+PLATFORMS: Final[tuple[Platform, ...]] = (
     Platform.SENSOR,
     Platform.SELECT,
     Platform.NUMBER,
     Platform.BUTTON,
     Platform.SWITCH,
     Platform.BINARY_SENSOR,
-]
+)
+
+# Shared read-only fallback for missing payload sections
+EMPTY_MAPPING: Final[Mapping[str, Any]] = MappingProxyType({})
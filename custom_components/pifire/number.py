@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 
+import aiohttp
+
 from homeassistant.components.number import NumberEntity, NumberDeviceClass, NumberMode
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfTemperature, UnitOfMass
@@ -13,9 +16,14 @@ from homeassistant.helpers.entity import DeviceInfo, EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
+from .pifire_client import PiFireError
 
 _LOGGER = logging.getLogger(__name__)
 
+# Setpoint limits per unit (~100°F to ~500°F)
+SETPOINT_MIN = {UnitOfTemperature.CELSIUS: 38, UnitOfTemperature.FAHRENHEIT: 100}
+SETPOINT_MAX = {UnitOfTemperature.CELSIUS: 260, UnitOfTemperature.FAHRENHEIT: 500}
+
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
@@ -54,6 +62,8 @@ class PiFireTemperatureSetpoint(NumberEntity):
         self._attr_device_info = device_info
         self._attr_unique_id = f"{entry.entry_id}_temperature_setpoint"
         self._last_set_value: float | None = None
+        self._cached_unit: str = UnitOfTemperature.FAHRENHEIT
+        self._update_unit()
 
     async def async_added_to_hass(self) -> None:
         """Subscribe to coordinator updates."""
@@ -67,11 +77,10 @@ class PiFireTemperatureSetpoint(NumberEntity):
 
     def _get_current_psp(self) -> float | None:
         """Get the current PSP (Primary Setpoint) value from coordinator data."""
-        data = self.coordinator.data or {}
-        current = data.get("current", {})
+        view = self.coordinator.view
 
         # Try PSP first (Primary Setpoint)
-        psp = current.get("PSP")
+        psp = view.current.get("PSP")
         if psp is not None:
             try:
                 return float(psp)
@@ -79,8 +88,7 @@ class PiFireTemperatureSetpoint(NumberEntity):
                 pass
 
         # Fallback to P.Grill if PSP not available
-        pmap = current.get("P", {})
-        setpoint = pmap.get("Grill")
+        setpoint = view.pmap.get("Grill")
         if setpoint is not None:
             try:
                 return float(setpoint)
@@ -89,8 +97,16 @@ class PiFireTemperatureSetpoint(NumberEntity):
 
         return None
 
+    def _update_unit(self) -> None:
+        """Cache the temperature unit reported by PiFire."""
+        units = str(self.coordinator.view.status.get("units", "")).upper()
+        self._cached_unit = (
+            UnitOfTemperature.CELSIUS if units == "C" else UnitOfTemperature.FAHRENHEIT
+        )
+
     def _initialize_from_coordinator(self) -> None:
         """Initialize the setpoint value from coordinator data."""
+        self._update_unit()
         current_psp = self._get_current_psp()
         if current_psp is not None:
             self._last_set_value = current_psp
@@ -102,36 +118,22 @@ class PiFireTemperatureSetpoint(NumberEntity):
             return False
 
         # Only available when in hold mode
-        data = self.coordinator.data or {}
-        status = data.get("status", {})
-        mode = status.get("mode", "").lower()
-        return mode == "hold"
+        return self.coordinator.view.mode == "hold"
 
     @property
     def native_unit_of_measurement(self) -> str:
         """Return the unit of measurement."""
-        data = self.coordinator.data or {}
-        status = data.get("status", {})
-        units = str(status.get("units", "")).upper()
-        return (
-            UnitOfTemperature.CELSIUS if units == "C" else UnitOfTemperature.FAHRENHEIT
-        )
+        return self._cached_unit
 
     @property
     def native_min_value(self) -> float:
         """Return the minimum value."""
-        # Return min value based on current unit
-        if self.native_unit_of_measurement == UnitOfTemperature.CELSIUS:
-            return 38  # ~100°F in Celsius
-        return 100  # 100°F
+        return SETPOINT_MIN[self._cached_unit]
 
     @property
     def native_max_value(self) -> float:
         """Return the maximum value."""
-        # Return max value based on current unit
-        if self.native_unit_of_measurement == UnitOfTemperature.CELSIUS:
-            return 260  # ~500°F in Celsius
-        return 500  # 500°F
+        return SETPOINT_MAX[self._cached_unit]
 
     @property
     def native_value(self) -> float | None:
@@ -148,7 +150,7 @@ class PiFireTemperatureSetpoint(NumberEntity):
             await self.client.set_hold_mode(value)
             _LOGGER.debug("Successfully set temperature setpoint to %s°", value)
 
-        except Exception as err:
+        except (PiFireError, aiohttp.ClientError, asyncio.TimeoutError) as err:
             _LOGGER.error("Failed to set temperature setpoint to %s°: %s", value, err)
             raise HomeAssistantError(
                 f"Failed to set temperature setpoint to {value}°"
@@ -157,6 +159,8 @@ class PiFireTemperatureSetpoint(NumberEntity):
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle coordinator update."""
+        self._update_unit()
+
         # Get current PSP from API
         current_psp = self._get_current_psp()
 
@@ -1,12 +1,29 @@
 from __future__ import annotations
+import asyncio
 import aiohttp
 import logging
+import time
 from typing import Any, Dict
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.util.json import json_loads
 
 _LOGGER = logging.getLogger(__name__)
 
+# Seconds to reuse a hopper response (including a failed one) before refetching
+HOPPER_CACHE_SECONDS = 30
+
+# Shared request timeout for all PiFire API calls
+_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
+
+class PiFireError(Exception):
+    """Base error raised by the PiFire client."""
+
+
+class PiFireAPIError(PiFireError):
+    """Error raised when the PiFire API returns an unexpected status."""
+
 
 class PiFireClient:
     """Client for interacting with PiFire API."""
@@ -14,117 +31,124 @@ class PiFireClient:
     def __init__(self, hass: HomeAssistant, host: str) -> None:
         """Initialize the client."""
         self._base = f"http://{host}".rstrip("/")
+        # Pre-built URL prefixes for the fixed-shape API paths
+        self._api = f"{self._base}/api/"
+        self._mode_url = f"{self._api}set/mode/"
         self._session = async_get_clientsession(hass)
+        self._hopper_cache: tuple[float, Dict[str, Any] | None] = (0.0, None)
 
     async def get_current(self) -> Dict[str, Any]:
         """Get current status data from PiFire."""
-        url = f"{self._base}/api/current"
+        url = self._api + "current"
         try:
-            async with self._session.get(
-                url, timeout=aiohttp.ClientTimeout(total=10)
-            ) as resp:
-                resp.raise_for_status()
-                return await resp.json(content_type=None)
-        except Exception as err:
+            async with self._session.get(url, timeout=_TIMEOUT) as resp:
+                if resp.status >= 400:
+                    _LOGGER.error("Failed to get current data: HTTP %s", resp.status)
+                    raise PiFireAPIError(f"HTTP {resp.status} from /api/current")
+                return json_loads(await resp.read())
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as err:
             _LOGGER.error("Failed to get current data: %s", err)
-            raise
+            raise PiFireError("Failed to get current data") from err
 
     async def get_hopper_data(self) -> Dict[str, Any]:
         """Get hopper/pellet data from PiFire."""
-        url = f"{self._base}/api/hopper"
+        fetched_at, cached = self._hopper_cache
+        if cached is not None and time.monotonic() - fetched_at < HOPPER_CACHE_SECONDS:
+            return cached
+
+        url = self._api + "hopper"
         try:
-            async with self._session.get(
-                url, timeout=aiohttp.ClientTimeout(total=10)
-            ) as resp:
-                resp.raise_for_status()
-                return await resp.json(content_type=None)
-        except Exception as err:
+            async with self._session.get(url, timeout=_TIMEOUT) as resp:
+                if resp.status >= 400:
+                    _LOGGER.debug(
+                        "Hopper data unavailable (may not be supported): HTTP %s",
+                        resp.status,
+                    )
+                    data = {}
+                else:
+                    data = json_loads(await resp.read())
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as err:
             _LOGGER.debug("Failed to get hopper data (may not be supported): %s", err)
-            return {}
+            data = {}
+
+        self._hopper_cache = (time.monotonic(), data)
+        return data
+
+    async def get_all(self) -> tuple[Dict[str, Any], Dict[str, Any]]:
+        """Get current status and hopper data concurrently."""
+        # get_hopper_data handles its own transport errors
+        current, hopper = await asyncio.gather(
+            self.get_current(), self.get_hopper_data()
+        )
+        return current, hopper
+
+    async def _get_ok(self, url: str, desc: str) -> None:
+        """Issue a command GET and raise PiFireError if it fails."""
+        try:
+            async with self._session.get(url, timeout=_TIMEOUT) as resp:
+                if resp.status >= 400:
+                    _LOGGER.error("Failed to %s: HTTP %s", desc, resp.status)
+                    raise PiFireAPIError(f"Failed to {desc}: HTTP {resp.status}")
+                _LOGGER.debug("%s succeeded", desc)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            _LOGGER.error("Failed to %s: %s", desc, err)
+            raise PiFireError(f"Failed to {desc}") from err
 
     async def set_mode(self, mode: str) -> None:
         """Set the PiFire mode."""
-        url = f"{self._base}/api/set/mode/{mode}"
-        try:
-            async with self._session.get(
-                url, timeout=aiohttp.ClientTimeout(total=10)
-            ) as response:
-                response.raise_for_status()
-                _LOGGER.debug("Successfully set PiFire mode to %s", mode)
-        except Exception as err:
-            _LOGGER.error("Failed to set mode %s: %s", mode, err)
-            raise Exception(f"Failed to set mode to {mode}") from err
+        await self._get_ok(self._mode_url + mode, f"set mode to {mode}")
 
     async def set_hold_mode(self, temperature: float) -> None:
         """Set the PiFire to hold mode at specified temperature."""
-        url = f"{self._base}/api/set/mode/hold/{temperature}"
+        await self._get_ok(
+            f"{self._mode_url}hold/{temperature}", f"set hold mode at {temperature}°"
+        )
+
+    async def _post_ok(self, url: str, desc: str) -> None:
+        """Issue a command POST and raise PiFireError unless it returns 200/201."""
         try:
-            async with self._session.get(
-                url, timeout=aiohttp.ClientTimeout(total=10)
-            ) as response:
-                response.raise_for_status()
-                _LOGGER.debug(
-                    "Successfully set PiFire to hold mode at %s°", temperature
-                )
-        except Exception as err:
-            _LOGGER.error("Failed to set hold mode at %s°: %s", temperature, err)
-            raise Exception(f"Failed to set hold mode") from err
+            async with self._session.post(url, timeout=_TIMEOUT) as resp:
+                if resp.status not in (200, 201):
+                    _LOGGER.error("Failed to %s: HTTP %s", desc, resp.status)
+                    raise PiFireAPIError(f"Failed to {desc}: HTTP {resp.status}")
+                _LOGGER.debug("%s succeeded", desc)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            _LOGGER.error("Failed to %s: %s", desc, err)
+            raise PiFireError(f"Failed to {desc}") from err
 
     async def send_command(self, endpoint: str) -> None:
         """Send a command to the PiFire API."""
-        url = f"{self._base}{endpoint}"
-        try:
-            async with self._session.post(
-                url, timeout=aiohttp.ClientTimeout(total=10)
-            ) as response:
-                if response.status != 200:
-                    raise Exception(f"API returned status {response.status}")
-                _LOGGER.debug("Successfully sent command to %s", endpoint)
-        except Exception as err:
-            _LOGGER.error("Failed to send command to %s: %s", endpoint, err)
-            raise
+        await self._post_ok(f"{self._base}{endpoint}", f"send command to {endpoint}")
+
+    async def post_mode(self, mode: str, temperature: int | None = None) -> None:
+        """Set the PiFire mode via POST, with a target for hold mode."""
+        if temperature is None:
+            await self._post_ok(self._mode_url + mode, f"set mode to {mode}")
+        else:
+            await self._post_ok(
+                f"{self._mode_url}{mode}/{temperature}",
+                f"set {mode} mode at {temperature}°",
+            )
+
+    async def post_pmode(self, p_mode: int) -> None:
+        """Set the P-Mode value via POST."""
+        await self._post_ok(
+            f"{self._api}set/pmode/{p_mode}", f"set P-Mode to P-{p_mode}"
+        )
 
     async def set_p_mode(self, p_mode: int) -> None:
         """Set the P-Mode value."""
-        url = f"{self._base}/api/set/pmode/{p_mode}"
-        try:
-            async with self._session.get(
-                url, timeout=aiohttp.ClientTimeout(total=10)
-            ) as response:
-                response.raise_for_status()
-                _LOGGER.debug("Successfully set P-Mode to P-%s", p_mode)
-        except Exception as err:
-            _LOGGER.error("Failed to set P-Mode to P-%s: %s", p_mode, err)
-            raise Exception(f"Failed to set P-Mode to P-{p_mode}") from err
+        await self._get_ok(
+            f"{self._api}set/pmode/{p_mode}", f"set P-Mode to P-{p_mode}"
+        )
 
     async def prime_pellets(self, grams: int, next_mode: str) -> None:
         """Prime pellets with specified grams and next mode."""
-        url = f"{self._base}/api/set/mode/prime/{grams}/{next_mode}"
-        try:
-            async with self._session.get(
-                url, timeout=aiohttp.ClientTimeout(total=10)
-            ) as response:
-                response.raise_for_status()
-                _LOGGER.debug(
-                    "Successfully started pellet priming: %s grams, next mode: %s",
-                    grams,
-                    next_mode,
-                )
-        except Exception as err:
-            _LOGGER.error(
-                "Failed to prime pellets (%s grams, %s): %s", grams, next_mode, err
-            )
-            raise Exception(f"Failed to prime pellets") from err
+        await self._get_ok(
+            f"{self._mode_url}prime/{grams}/{next_mode}",
+            f"prime pellets ({grams} grams, next mode: {next_mode})",
+        )
 
     async def set_smoke_plus(self, enabled: bool) -> None:
         """Enable or disable Smoke Plus mode."""
-        url = f"{self._base}/api/set/smokeplus/{str(enabled).lower()}"
-        try:
-            async with self._session.get(
-                url, timeout=aiohttp.ClientTimeout(total=10)
-            ) as response:
-                response.raise_for_status()
-                _LOGGER.debug("Successfully set Smoke Plus to %s", enabled)
-        except Exception as err:
-            _LOGGER.error("Failed to set Smoke Plus to %s: %s", enabled, err)
-            raise Exception(f"Failed to set Smoke Plus to {enabled}") from err
+        await self.send_command(f"/api/set/splus/{str(enabled).lower()}")
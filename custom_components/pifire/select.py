@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from types import MappingProxyType
 from typing import Any
 
 import aiohttp
@@ -11,14 +13,18 @@ from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.entity import DeviceInfo, EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN
+from .const import DOMAIN, EMPTY_MAPPING
+from .pifire_client import PiFireError
 
 _LOGGER = logging.getLogger(__name__)
 
+# Mode selector options, keyed by the lowercase mode PiFire reports
+MODE_OPTIONS = ("Stop", "Startup", "Smoke", "Hold", "Shutdown", "Monitor")
+MODE_TITLES = MappingProxyType({option.lower(): option for option in MODE_OPTIONS})
+
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
@@ -26,12 +32,13 @@ async def async_setup_entry(
     """Set up PiFire select entities from a config entry."""
     data = hass.data[DOMAIN][entry.entry_id]
     coordinator = data["coordinator"]
+    client = data["client"]
     device_info = data["device_info"]
 
     async_add_entities(
         [
-            PiFireModeSelector(entry, coordinator, device_info),
-            PiFirePModeSelector(entry, coordinator, device_info),
+            PiFireModeSelector(entry, coordinator, client, device_info),
+            PiFirePModeSelector(entry, coordinator, client, device_info),
         ]
     )
 
@@ -44,21 +51,16 @@ class PiFireModeSelector(SelectEntity):
     _attr_icon = "mdi:grill-outline"
 
     def __init__(
-        self, entry: ConfigEntry, coordinator, device_info: DeviceInfo
+        self, entry: ConfigEntry, coordinator, client, device_info: DeviceInfo
     ) -> None:
         """Initialize the Mode selector."""
         self._entry = entry
         self.coordinator = coordinator
+        self.client = client
         self._attr_device_info = device_info
         self._attr_unique_id = f"{entry.entry_id}_mode"
-        self._attr_options = [
-            "Stop",
-            "Startup",
-            "Smoke",
-            "Hold",
-            "Shutdown",
-            "Monitor",
-        ]
+        self._attr_options = list(MODE_OPTIONS)
+        self._options_set: frozenset[str] = frozenset(self._attr_options)
 
     async def async_added_to_hass(self) -> None:
         """Subscribe to coordinator updates."""
@@ -69,75 +71,47 @@ class PiFireModeSelector(SelectEntity):
     @property
     def current_option(self) -> str | None:
         """Return the current mode setting."""
-        data = self.coordinator.data or {}
-        status = data.get("status", {})
-
-        mode = status.get("mode")
-        if mode and mode.title() in self.options:
-            return mode.title()
-
         # Fallback to Stop if mode not recognized
-        return "Stop"
+        return MODE_TITLES.get(self.coordinator.view.mode, "Stop")
 
     async def async_select_option(self, option: str) -> None:
         """Set the mode."""
-        if option not in self.options:
+        if option not in self._options_set:
             raise HomeAssistantError(f"Invalid mode option: {option}")
 
         try:
-            # Build URL from config entry data
-            host = self._entry.data.get("host", "localhost")
-            port = self._entry.data.get("port", 80)
-            base_url = f"http://{host}:{port}"
-
             mode_lower = option.lower()
 
             # Special handling for Hold mode - needs temperature parameter
             if mode_lower == "hold":
                 # Get current grill temperature or use a default
-                data = self.coordinator.data or {}
-                current = data.get("current", {})
-                pmap = current.get("P", {})
-                grill_temp = pmap.get("Grill", 225)  # Default to 225°F
-
-                # Ensure temperature is within reasonable range
-                if (
-                    not isinstance(grill_temp, (int, float))
-                    or grill_temp < 100
-                    or grill_temp > 500
-                ):
+                grill_temp = self.coordinator.view.pmap.get("Grill", 225)
+
+                # Fall back to 225°F unless the reading is a reasonable hold target
+                try:
+                    grill_temp = float(grill_temp)
+                except (TypeError, ValueError):
                     grill_temp = 225
+                if not 100 <= grill_temp <= 500:
+                    grill_temp = 225
+                grill_temp = int(grill_temp)
 
-                url = f"{base_url}/api/set/mode/hold/{int(grill_temp)}"
+                await self.client.post_mode("hold", grill_temp)
             else:
-                url = f"{base_url}/api/set/mode/{mode_lower}"
-
-            # Use Home Assistant's session
-            session = async_get_clientsession(self.hass)
-
-            async with session.post(url) as response:
-                # Accept both 200 (OK) and 201 (Created) as success
-                if response.status not in (200, 201):
-                    response_text = await response.text()
-                    raise HomeAssistantError(
-                        f"API returned {response.status}: {response_text}"
-                    )
+                await self.client.post_mode(mode_lower)
 
             # Request immediate data refresh to update the selector
             await self.coordinator.async_request_refresh()
 
-        except aiohttp.ClientError as err:
-            _LOGGER.error("Failed to set mode to %s: %s", option, err)
-            raise HomeAssistantError(f"Failed to set mode: {err}") from err
-        except Exception as err:
+        except (PiFireError, aiohttp.ClientError, asyncio.TimeoutError) as err:
             _LOGGER.error("Failed to set mode to %s: %s", option, err)
             raise HomeAssistantError(f"Failed to set mode: {err}") from err
 
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return additional state attributes."""
-        data = self.coordinator.data or {}
-        status = data.get("status", {})
+        data = self.coordinator.data or EMPTY_MAPPING
+        status = data.get("status") or EMPTY_MAPPING
 
         attributes = {}
 
@@ -156,8 +130,8 @@ class PiFireModeSelector(SelectEntity):
             attributes["status_detail"] = status["status"]
 
         # Add current target temperature for hold mode
-        current = data.get("current", {})
-        pmap = current.get("P", {})
+        current = data.get("current") or EMPTY_MAPPING
+        pmap = current.get("P") or EMPTY_MAPPING
         grill_temp = pmap.get("Grill")
         if grill_temp is not None:
             attributes["target_temperature"] = grill_temp
@@ -179,11 +153,12 @@ class PiFirePModeSelector(SelectEntity):
     _attr_entity_category = EntityCategory.CONFIG
 
     def __init__(
-        self, entry: ConfigEntry, coordinator, device_info: DeviceInfo
+        self, entry: ConfigEntry, coordinator, client, device_info: DeviceInfo
     ) -> None:
         """Initialize the P-Mode selector."""
         self._entry = entry
         self.coordinator = coordinator
+        self.client = client
         self._attr_device_info = device_info
         self._attr_unique_id = f"{entry.entry_id}_pmode"
         self._attr_options = [
@@ -198,6 +173,7 @@ class PiFirePModeSelector(SelectEntity):
             "P8",
             "P9",
         ]
+        self._options_set: frozenset[str] = frozenset(self._attr_options)
 
     async def async_added_to_hass(self) -> None:
         """Subscribe to coordinator updates."""
@@ -208,8 +184,8 @@ class PiFirePModeSelector(SelectEntity):
     @property
     def current_option(self) -> str | None:
         """Return the current P-Mode setting."""
-        data = self.coordinator.data or {}
-        status = data.get("status", {})
+        data = self.coordinator.data or EMPTY_MAPPING
+        status = data.get("status") or EMPTY_MAPPING
 
         # Get current P-Mode from status
         pmode = status.get("pmode")
@@ -222,7 +198,7 @@ class PiFirePModeSelector(SelectEntity):
                 pass
 
         # Default fallback - check for last used or default to P1
-        settings = status.get("settings", {})
+        settings = status.get("settings") or EMPTY_MAPPING
         last_pmode = settings.get("last_pmode", 1)
         try:
             last_pmode_num = int(last_pmode)
@@ -241,16 +217,12 @@ class PiFirePModeSelector(SelectEntity):
 
     def _is_pmode_active(self) -> bool:
         """Check if P-Mode switch is currently ON."""
-        data = self.coordinator.data or {}
-        status = data.get("status", {})
-
         # Check if currently in P-Mode (not Manual, Recipe, etc.)
-        mode = status.get("mode", "").lower()
-        return mode == "hold"
+        return self.coordinator.view.mode == "hold"
 
     async def async_select_option(self, option: str) -> None:
         """Set the P-Mode."""
-        if option not in self.options:
+        if option not in self._options_set:
             raise HomeAssistantError(f"Invalid P-Mode option: {option}")
 
         # Check if P-Mode switch is ON
@@ -267,39 +239,20 @@ class PiFirePModeSelector(SelectEntity):
             raise HomeAssistantError(f"Invalid P-Mode format: {option}")
 
         try:
-            # Build URL from config entry data
-            host = self._entry.data.get("host", "localhost")
-            port = self._entry.data.get("port", 80)
-            base_url = f"http://{host}:{port}"
-
-            url = f"{base_url}/api/set/pmode/{pmode_num}"
-
-            # Use Home Assistant's session
-            session = async_get_clientsession(self.hass)
-
-            async with session.post(url) as response:
-                # Accept both 200 (OK) and 201 (Created) as success
-                if response.status not in (200, 201):
-                    response_text = await response.text()
-                    raise HomeAssistantError(
-                        f"API returned {response.status}: {response_text}"
-                    )
+            await self.client.post_pmode(pmode_num)
 
             # Request immediate data refresh to update the selector
             await self.coordinator.async_request_refresh()
 
-        except aiohttp.ClientError as err:
-            _LOGGER.error("Failed to set P-Mode to %s: %s", option, err)
-            raise HomeAssistantError(f"Failed to set P-Mode: {err}") from err
-        except Exception as err:
+        except (PiFireError, aiohttp.ClientError, asyncio.TimeoutError) as err:
             _LOGGER.error("Failed to set P-Mode to %s: %s", option, err)
             raise HomeAssistantError(f"Failed to set P-Mode: {err}") from err
 
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return additional state attributes."""
-        data = self.coordinator.data or {}
-        status = data.get("status", {})
+        data = self.coordinator.data or EMPTY_MAPPING
+        status = data.get("status") or EMPTY_MAPPING
 
         attributes = {}
 
@@ -317,12 +270,12 @@ class PiFirePModeSelector(SelectEntity):
             attributes["current_mode"] = mode
 
         # Add any P-Mode related settings
-        settings = status.get("settings", {})
+        settings = status.get("settings") or EMPTY_MAPPING
         if "last_pmode" in settings:
             attributes["last_pmode"] = settings["last_pmode"]
 
         # Add P-Mode descriptions if available in status
-        pmode_config = status.get("pmode_config", {})
+        pmode_config = status.get("pmode_config") or EMPTY_MAPPING
         if pmode_config:
             attributes["pmode_config"] = pmode_config
 
@@ -4,7 +4,11 @@ from __future__ import annotations
 
 import logging
 import re
-from datetime import datetime, timezone
+import string
+import sys
+from collections.abc import Mapping
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -14,14 +18,41 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.entity import DeviceInfo, EntityCategory
+from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN
+from .const import DOMAIN, EMPTY_MAPPING
 
 _LOGGER = logging.getLogger(__name__)
 
+_TRAILING_DIGITS = re.compile(r"(?<=\D)(\d+)$")
+
+
+class _SlugTable(dict):
+    """str.translate table: keep [a-z0-9_], map space to "_", drop the rest."""
+
+    def __missing__(self, key: int) -> None:
+        return None
+
+
+_SLUG_TABLE = _SlugTable(
+    {ord(c): ord(c) for c in string.ascii_lowercase + string.digits + "_"}
+)
+_SLUG_TABLE[ord(" ")] = ord("_")
+
+# Marker for "no state written yet"
+_UNSET = object()
+
+# Modes in which the runtime sensor is tracking
+_RUNTIME_MODES = frozenset({"smoke", "hold", "monitor", "startup", "shutdown"})
+
+# How often the runtime advances on its own (matches the fastest poll rate);
+# identical polls do not notify listeners, so the clock cannot rely on them
+_RUNTIME_REFRESH = timedelta(seconds=5)
+
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
@@ -59,44 +90,66 @@ class _SensorManager:
         self.device_info = device_info
         self.async_add_entities = async_add_entities
         self._created: set[str] = set()
+        self._known_labels: set[str] = set()
+        self._last_probe_sig: tuple[Any, ...] | None = None
 
     def discover_from_payload(self, payload: dict[str, Any] | None) -> None:
         """Discover sensors from payload data."""
         if not isinstance(payload, dict):
             return
 
-        status = payload.get("status") or {}
-        current = payload.get("current") or {}
-        ftemps: dict[str, Any] = current.get("F") or {}
-        nt: dict[str, Any] = current.get("NT") or {}
-        pmap: dict[str, Any] = current.get("P") or {}
-        hopper = payload.get("hopper") or {}
+        status = payload.get("status") or EMPTY_MAPPING
+        current = payload.get("current") or EMPTY_MAPPING
+        ftemps: Mapping[str, Any] = current.get("F") or EMPTY_MAPPING
+        nt: Mapping[str, Any] = current.get("NT") or EMPTY_MAPPING
+        pmap: Mapping[str, Any] = current.get("P") or EMPTY_MAPPING
+        hopper = payload.get("hopper") or EMPTY_MAPPING
+
+        # Probe labels PiFire reports as enabled
+        enabled_labels: set[str] = set()
+
+        probe_status = status.get("probe_status")
+        if not isinstance(probe_status, dict):
+            probe_status = {}
+        for group_key in ("P", "F", "AUX"):
+            group = probe_status.get(group_key)
+            if not isinstance(group, dict):
+                continue
+            for label, meta in group.items():
+                if isinstance(meta, dict) and meta.get("enabled"):
+                    enabled_labels.add(label if type(label) is str else str(label))
+
+        # Fallback: if probe_status missing or empty, use whatever appears in F/NT/P
+        if not enabled_labels:
+            enabled_labels = ftemps.keys() | nt.keys() | pmap.keys()
+
+        # Fast path: nothing new can be created if the static sensors exist
+        # and the reported, enabled probe labels and hopper support are unchanged
+        probe_sig = (
+            frozenset(ftemps.keys() | nt.keys() | pmap.keys()),
+            frozenset(enabled_labels),
+            isinstance(hopper, dict) and "hopper_level" in hopper,
+        )
+        if probe_sig == self._last_probe_sig:
+            return
+
+        new_entities: list[SensorEntity] = []
+        new_keys: list[str] = []
+        new_labels: list[str] = []
 
         # ---- Recipe Sensor ----
         if "recipe" not in self._created:
-            try:
-                self.async_add_entities(
-                    [PiFireRecipeSensor(self.entry, self.coordinator, self.device_info)]
-                )
-                self._created.add("recipe")
-                _LOGGER.debug("PiFire: created Recipe sensor")
-            except Exception:
-                _LOGGER.exception("PiFire: failed to create Recipe sensor")
+            new_entities.append(
+                PiFireRecipeSensor(self.entry, self.coordinator, self.device_info)
+            )
+            new_keys.append("recipe")
 
         # ---- Runtime Sensor ----
         if "runtime" not in self._created:
-            try:
-                self.async_add_entities(
-                    [
-                        PiFireRuntimeSensor(
-                            self.entry, self.coordinator, self.device_info
-                        )
-                    ]
-                )
-                self._created.add("runtime")
-                _LOGGER.debug("PiFire: created Runtime sensor")
-            except Exception:
-                _LOGGER.exception("PiFire: failed to create Runtime sensor")
+            new_entities.append(
+                PiFireRuntimeSensor(self.entry, self.coordinator, self.device_info)
+            )
+            new_keys.append("runtime")
 
         # ---- Pellet Level Sensor (if hopper data available) ----
         if (
@@ -104,74 +157,48 @@ class _SensorManager:
             and "hopper_level" in hopper
             and "pellet_level" not in self._created
         ):
-            try:
-                self.async_add_entities(
-                    [
-                        PiFirePelletLevelSensor(
-                            self.entry, self.coordinator, self.device_info
-                        )
-                    ]
-                )
-                self._created.add("pellet_level")
-                _LOGGER.debug("PiFire: created Pellet Level sensor")
-            except Exception:
-                _LOGGER.exception("PiFire: failed to create Pellet Level sensor")
+            new_entities.append(
+                PiFirePelletLevelSensor(self.entry, self.coordinator, self.device_info)
+            )
+            new_keys.append("pellet_level")
 
         # ---- Enabled probes → temperature sensors ----
-        enabled_labels: list[str] = []
-
-        probe_status = status.get("probe_status") or {}
-        for group_key in ("P", "F", "AUX"):
-            group = probe_status.get(group_key) or {}
-            if isinstance(group, dict):
-                for label, meta in group.items():
-                    if isinstance(meta, dict) and meta.get("enabled", False):
-                        enabled_labels.append(str(label))
-
-        # Fallback: if probe_status missing or empty, use whatever appears in F/NT/P
-        if not enabled_labels:
-            enabled_labels = sorted(
-                set(list(ftemps.keys()) + list(nt.keys()) + list(pmap.keys()))
-            )
+        # Only labels that do not have a sensor yet need any further work
+        pending_labels = enabled_labels - self._known_labels
 
         # Ensure Grill appears first if enabled for nicer UI ordering
-        enabled_labels_sorted = sorted(
-            enabled_labels, key=lambda x: (x.lower() != "grill", x)
-        )
-
-        new_entities: list[SensorEntity] = []
-        for label in enabled_labels_sorted:
+        for label in sorted(pending_labels, key=lambda x: (x.lower() != "grill", x)):
             # Only add if a value exists somewhere
             exists = (label in ftemps) or (label in nt) or (label in pmap)
             if not exists:
                 continue
 
-            key = f"probe:{label}"
-            if key in self._created:
-                continue
-
-            try:
-                new_entities.append(
-                    PiFireProbeTempSensor(
-                        entry=self.entry,
-                        coordinator=self.coordinator,
-                        device_info=self.device_info,
-                        label=label,
-                        friendly_name=_pretty_probe_name(label),
-                    )
-                )
-                self._created.add(key)
-                _LOGGER.debug("PiFire: created probe sensor for label '%s'", label)
-            except Exception:
-                _LOGGER.exception(
-                    "PiFire: failed to create probe sensor for '%s'", label
+            new_entities.append(
+                PiFireProbeTempSensor(
+                    entry=self.entry,
+                    coordinator=self.coordinator,
+                    device_info=self.device_info,
+                    label=label,
+                    friendly_name=_pretty_probe_name(label),
                 )
+            )
+            new_labels.append(label)
 
+        # Add everything discovered in this pass with a single call
         if new_entities:
-            self.async_add_entities(new_entities)
+            _LOGGER.debug(
+                "PiFire: adding sensors %s and probes %s", new_keys, new_labels
+            )
+            self.async_add_entities(new_entities, update_before_add=False)
+            self._created.update(new_keys)
+            self._known_labels.update(new_labels)
+
+        # Remember the payload shape once the always-present sensors exist
+        if {"recipe", "runtime"} <= self._created:
+            self._last_probe_sig = probe_sig
 
 
-class PiFireRecipeSensor(SensorEntity):
+class PiFireRecipeSensor(CoordinatorEntity, SensorEntity):
     """Boolean sensor showing if a recipe is currently active."""
 
     _attr_has_entity_name = True
@@ -182,32 +209,23 @@ class PiFireRecipeSensor(SensorEntity):
         self, entry: ConfigEntry, coordinator, device_info: DeviceInfo
     ) -> None:
         """Initialize the recipe sensor."""
+        super().__init__(coordinator)
         self._entry = entry
-        self.coordinator = coordinator
         self._attr_device_info = device_info
         self._attr_unique_id = f"{entry.entry_id}_recipe"
-
-    async def async_added_to_hass(self) -> None:
-        """Subscribe to coordinator updates."""
-        self.async_on_remove(
-            self.coordinator.async_add_listener(self._handle_coordinator_update)
-        )
+        self._last_state: Any = _UNSET
 
     @property
     def native_value(self) -> bool:
         """Return True if a recipe is currently active."""
-        data = self.coordinator.data or {}
-        status = data.get("status") or {}
-
         # Check the mode to determine if a recipe is active
-        mode = status.get("mode", "").lower()
-        return mode == "recipe"
+        return self.coordinator.view.mode == "recipe"
 
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return additional state attributes."""
-        data = self.coordinator.data or {}
-        status = data.get("status") or {}
+        view = self.coordinator.view
+        status = view.status
 
         attributes = {}
 
@@ -227,7 +245,7 @@ class PiFireRecipeSensor(SensorEntity):
             attributes["recipe_name"] = recipe_name
 
         # Add startup/shutdown durations if in recipe mode
-        if status.get("mode", "").lower() == "recipe":
+        if view.mode == "recipe":
             if "start_duration" in status:
                 attributes["start_duration"] = status["start_duration"]
             if "shutdown_duration" in status:
@@ -240,10 +258,15 @@ class PiFireRecipeSensor(SensorEntity):
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle coordinator update."""
+        # Skip the state write when nothing visible has changed
+        state = (self.native_value, self.available, self.extra_state_attributes)
+        if state == self._last_state:
+            return
+        self._last_state = state
         self.async_write_ha_state()
 
 
-class PiFireRuntimeSensor(SensorEntity):
+class PiFireRuntimeSensor(CoordinatorEntity, SensorEntity):
     """Sensor showing how long PiFire has been running since startup."""
 
     _attr_has_entity_name = True
@@ -254,17 +277,53 @@ class PiFireRuntimeSensor(SensorEntity):
         self, entry: ConfigEntry, coordinator, device_info: DeviceInfo
     ) -> None:
         """Initialize the runtime sensor."""
+        super().__init__(coordinator)
         self._entry = entry
-        self.coordinator = coordinator
         self._attr_device_info = device_info
         self._attr_unique_id = f"{entry.entry_id}_runtime"
+        self._start_raw: Any = _UNSET
+        self._start_dt: datetime | None = None
+        self._total_seconds: int | None = None
+        self._in_runtime_mode = False
+        # Last formatted runtime, keyed by its total seconds
+        self._last_total_seconds = -1
+        self._last_str = "00:00:00"
+        self._refresh_runtime()
 
     async def async_added_to_hass(self) -> None:
-        """Subscribe to coordinator updates."""
+        """Subscribe to coordinator updates and the runtime clock."""
+        await super().async_added_to_hass()
         self.async_on_remove(
-            self.coordinator.async_add_listener(self._handle_coordinator_update)
+            async_track_time_interval(
+                self.hass, self._async_refresh_clock, _RUNTIME_REFRESH
+            )
         )
 
+    def _refresh_runtime(self) -> None:
+        """Compute the start time and elapsed seconds once per update."""
+        view = self.coordinator.view
+        start_time = view.status.get("start_time")
+        self._in_runtime_mode = view.mode in _RUNTIME_MODES
+
+        # Only re-parse the epoch timestamp when PiFire reports a new one
+        if start_time != self._start_raw:
+            self._start_raw = start_time
+            try:
+                self._start_dt = (
+                    datetime.fromtimestamp(float(start_time), tz=timezone.utc)
+                    if start_time is not None
+                    else None
+                )
+            except (TypeError, ValueError, OSError):
+                self._start_dt = None
+
+        if self._start_dt is None:
+            self._total_seconds = None
+        else:
+            # Ensure non-negative runtime
+            runtime_delta = dt_util.utcnow() - self._start_dt
+            self._total_seconds = max(0, int(runtime_delta.total_seconds()))
+
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
@@ -272,10 +331,7 @@ class PiFireRuntimeSensor(SensorEntity):
             return False
 
         # Only available when in runtime-tracking modes
-        data = self.coordinator.data or {}
-        status = data.get("status", {})
-        mode = status.get("mode", "").lower()
-        return mode in {"smoke", "hold", "monitor", "startup", "shutdown"}
+        return self._in_runtime_mode
 
     @property
     def native_value(self) -> str | None:
@@ -284,35 +340,17 @@ class PiFireRuntimeSensor(SensorEntity):
         if not self.available:
             return None
 
-        data = self.coordinator.data or {}
-        status = data.get("status", {})
-
-        # Get start_time timestamp
-        start_time = status.get("start_time")
-        if start_time is None:
+        total_seconds = self._total_seconds
+        if total_seconds is None:
             return "00:00:00"
 
-        try:
-            # Convert start_time epoch timestamp to datetime
-            start_datetime = datetime.fromtimestamp(float(start_time), tz=timezone.utc)
-
-            # Calculate runtime in seconds
-            now = dt_util.utcnow()
-            runtime_delta = now - start_datetime
-            total_seconds = int(runtime_delta.total_seconds())
-
-            # Ensure non-negative runtime
-            if total_seconds < 0:
-                total_seconds = 0
-
-            # Format as HH:MM:SS
-            hours = total_seconds // 3600
-            minutes = (total_seconds % 3600) // 60
-            seconds = total_seconds % 60
-
-            return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-        except (TypeError, ValueError, OSError):
-            return "00:00:00"
+        # Format as HH:MM:SS, only when the value has moved on
+        if total_seconds != self._last_total_seconds:
+            hours, rem = divmod(total_seconds, 3600)
+            minutes, seconds = divmod(rem, 60)
+            self._last_total_seconds = total_seconds
+            self._last_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+        return self._last_str
 
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
@@ -321,99 +359,41 @@ class PiFireRuntimeSensor(SensorEntity):
         if not self.available:
             return None
 
-        data = self.coordinator.data or {}
-        status = data.get("status", {})
-
         attributes = {}
 
         # Add current mode for reference
-        mode = status.get("mode")
+        mode = self.coordinator.view.status.get("mode")
         if mode:
             attributes["mode"] = mode
 
-        # Add start_time timestamp as attribute
-        start_time = status.get("start_time")
+        # Add start_time timestamp and total runtime in seconds for reference
+        start_time = self._start_raw
         if start_time:
-            try:
-                start_datetime = datetime.fromtimestamp(
-                    float(start_time), tz=timezone.utc
-                )
-                attributes["start_time"] = start_datetime.isoformat()
+            if self._start_dt is not None:
+                attributes["start_time"] = self._start_dt.isoformat()
                 attributes["start_time_epoch"] = float(start_time)
-            except (TypeError, ValueError, OSError):
+                attributes["total_seconds"] = self._total_seconds
+            else:
                 attributes["start_time_epoch"] = start_time
 
-        # Add total runtime in seconds for reference
-        if start_time:
-            try:
-                start_datetime = datetime.fromtimestamp(
-                    float(start_time), tz=timezone.utc
-                )
-                now = dt_util.utcnow()
-                runtime_delta = now - start_datetime
-                total_seconds = max(0, int(runtime_delta.total_seconds()))
-                attributes["total_seconds"] = total_seconds
-            except (TypeError, ValueError, OSError):
-                pass
-
         return attributes if attributes else None
 
     @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle coordinator update."""
+    def _async_refresh_clock(self, now: datetime) -> None:
+        """Advance the runtime between coordinator updates."""
+        if not self._in_runtime_mode or self._start_dt is None:
+            return
+        self._refresh_runtime()
         self.async_write_ha_state()
 
-
-class PiFireOutputPinSensor(SensorEntity):
-    """Boolean sensor showing output pin relay state."""
-
-    _attr_has_entity_name = True
-
-    def __init__(
-        self,
-        entry: ConfigEntry,
-        coordinator,
-        device_info: DeviceInfo,
-        pin_key: str,
-        name: str,
-        icon: str,
-        diagnostic: bool = False,
-    ) -> None:
-        """Initialize the output pin sensor."""
-        self._entry = entry
-        self.coordinator = coordinator
-        self._attr_device_info = device_info
-        self._pin_key = pin_key
-        self._attr_name = name
-        self._attr_icon = icon
-        self._attr_unique_id = f"{entry.entry_id}_{pin_key}_relay"
-
-        if diagnostic:
-            self._attr_entity_category = EntityCategory.DIAGNOSTIC
-
-    async def async_added_to_hass(self) -> None:
-        """Subscribe to coordinator updates."""
-        self.async_on_remove(
-            self.coordinator.async_add_listener(self._handle_coordinator_update)
-        )
-
-    @property
-    def native_value(self) -> bool | None:
-        """Return the output pin state."""
-        data = self.coordinator.data or {}
-        status = data.get("status") or {}
-        outpins = status.get("outpins") or {}
-
-        pin_state = outpins.get(self._pin_key)
-        return bool(pin_state) if pin_state is not None else None
-
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle coordinator update."""
+        self._refresh_runtime()
         self.async_write_ha_state()
 
 
-class PiFirePelletLevelSensor(SensorEntity):
+class PiFirePelletLevelSensor(CoordinatorEntity, SensorEntity):
     """Sensor showing pellet level percentage."""
 
     _attr_has_entity_name = True
@@ -426,23 +406,16 @@ class PiFirePelletLevelSensor(SensorEntity):
         self, entry: ConfigEntry, coordinator, device_info: DeviceInfo
     ) -> None:
         """Initialize the pellet level sensor."""
+        super().__init__(coordinator)
         self._entry = entry
-        self.coordinator = coordinator
         self._attr_device_info = device_info
         self._attr_unique_id = f"{entry.entry_id}_pellet_level"
-
-    async def async_added_to_hass(self) -> None:
-        """Subscribe to coordinator updates."""
-        self.async_on_remove(
-            self.coordinator.async_add_listener(self._handle_coordinator_update)
-        )
+        self._last_state: Any = _UNSET
 
     @property
     def native_value(self) -> int | None:
         """Return the pellet level percentage."""
-        data = self.coordinator.data or {}
-        hopper = data.get("hopper") or {}
-        level = hopper.get("hopper_level")
+        level = self.coordinator.view.hopper.get("hopper_level")
 
         try:
             return int(level) if level is not None else None
@@ -452,9 +425,7 @@ class PiFirePelletLevelSensor(SensorEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return additional state attributes."""
-        data = self.coordinator.data or {}
-        hopper = data.get("hopper") or {}
-        pellets = hopper.get("hopper_pellets")
+        pellets = self.coordinator.view.hopper.get("hopper_pellets")
 
         attributes = {}
         if pellets:
@@ -465,10 +436,15 @@ class PiFirePelletLevelSensor(SensorEntity):
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle coordinator update."""
+        # Skip the state write when nothing visible has changed
+        state = (self.native_value, self.available, self.extra_state_attributes)
+        if state == self._last_state:
+            return
+        self._last_state = state
         self.async_write_ha_state()
 
 
-class PiFireProbeTempSensor(SensorEntity):
+class PiFireProbeTempSensor(CoordinatorEntity, SensorEntity):
     """Temperature sensor for a probe label."""
 
     _attr_has_entity_name = True
@@ -484,87 +460,63 @@ class PiFireProbeTempSensor(SensorEntity):
         friendly_name: str,
     ) -> None:
         """Initialize the probe temperature sensor."""
+        super().__init__(coordinator)
         self._entry = entry
-        self.coordinator = coordinator
         self._attr_device_info = device_info
-        self._label = label
+        # Interned: the label is used as a dict key on every state read
+        self._label = sys.intern(label)
         self._attr_name = friendly_name
         self._attr_unique_id = f"{entry.entry_id}_temp_{_slugify(label)}"
-
-    async def async_added_to_hass(self) -> None:
-        """Subscribe to coordinator updates."""
-        self.async_on_remove(
-            self.coordinator.async_add_listener(self._handle_coordinator_update)
-        )
+        self._last_state: Any = _UNSET
+        self._is_grill = label.lower() == "grill"
+        # (raw units value, unit string) from the last lookup
+        self._unit_cache: tuple[Any, str] = (None, "°F")
+        self._value = self._read_value()
 
     @property
     def native_unit_of_measurement(self) -> str:
         """Return the unit of measurement."""
-        units = str(
-            ((self.coordinator.data or {}).get("status") or {}).get("units") or ""
-        ).upper()
-        return "°C" if units == "C" else "°F"
+        units = self.coordinator.view.status.get("units")
+        if units != self._unit_cache[0]:
+            unit = "°C" if str(units or "").upper() == "C" else "°F"
+            self._unit_cache = (units, unit)
+        return self._unit_cache[1]
 
     @property
     def native_value(self) -> float | None:
         """Return the temperature value."""
-        data = self.coordinator.data or {}
-        status = data.get("status") or {}
-        cur = data.get("current") or {}
-        ftemps: dict[str, Any] = cur.get("F") or {}
-        nt: dict[str, Any] = cur.get("NT") or {}
-        pmap: dict[str, Any] = cur.get("P") or {}
+        return self._value
+
+    def _read_value(self) -> float | None:
+        """Read the temperature from the latest coordinator data."""
+        view = self.coordinator.view
 
         # Check mode - if "Stop", return 0 for Grill temperature
-        mode = status.get("mode", "").lower()
-        if self._label.lower() == "grill" and mode == "stop":
+        if self._is_grill and view.mode == "stop":
             return 0.0
 
-        def _num(x: Any) -> float | None:
-            try:
-                # Handle "Unknown" string values
-                if isinstance(x, str) and x.lower() == "unknown":
-                    return 0.0
-                return float(x)
-            except (TypeError, ValueError):
-                return None
-
-        label = self._label
-
         # For Grill temperature, use P["Grill"] value specifically
-        if label.lower() == "grill":
-            grill_temp = _num(pmap.get("Grill"))
-            return grill_temp
+        if self._is_grill:
+            return _num(view.pmap.get("Grill"))
 
         # For other probes, use F[label] first, then NT[label] as fallback
-        val = _num(ftemps.get(label))
-        if val is None or val == 0:
-            alt = _num(nt.get(label))
-            val = alt if alt not in (None, 0) else val
-
+        val = _num(view.ftemps.get(self._label))
+        if not val:
+            alt = _num(view.nt.get(self._label))
+            if alt:
+                return alt
         return val
 
     @property
     def icon(self) -> str:
         """Return the icon based on probe type."""
         # Special case for grill
-        if self._label.lower() == "grill":
+        if self._is_grill:
             return "mdi:grill"
 
         # Check if this probe is a Bluetooth thermostat
-        data = self.coordinator.data or {}
-        thermostats = data.get("thermostats", {})
-
-        # Look for this probe label in thermostats data
-        for thermostat_id, thermostat_data in thermostats.items():
-            if isinstance(thermostat_data, dict):
-                # Check if this thermostat corresponds to our probe label
-                thermostat_label = thermostat_data.get("label", "")
-                if thermostat_label == self._label:
-                    # Found matching thermostat - check if it's Bluetooth
-                    connection_type = thermostat_data.get("type", "").lower()
-                    if "bluetooth" in connection_type or "bt" in connection_type:
-                        return "mdi:thermometer-bluetooth"
+        if self._label in self.coordinator.view.bluetooth_labels:
+            return "mdi:thermometer-bluetooth"
 
         # Default thermometer icon for non-Bluetooth probes
         return "mdi:thermometer"
@@ -572,19 +524,12 @@ class PiFireProbeTempSensor(SensorEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return additional state attributes with probe metadata."""
-        data = self.coordinator.data or {}
-        status = data.get("status") or {}
-        probe_status = status.get("probe_status") or {}
+        view = self.coordinator.view
 
         attributes = {}
 
         # Find probe metadata in probe_status
-        probe_meta = None
-        for group_key in ("P", "F", "AUX"):
-            group = probe_status.get(group_key) or {}
-            if isinstance(group, dict) and self._label in group:
-                probe_meta = group[self._label]
-                break
+        probe_meta = view.probe_index.get(self._label)
 
         if probe_meta and isinstance(probe_meta, dict):
             # Device information
@@ -665,9 +610,8 @@ class PiFireProbeTempSensor(SensorEntity):
                     attributes["error"] = error
 
         # Add current temperature values from other sources for comparison
-        current = data.get("current") or {}
-        ftemps = current.get("F") or {}
-        nt = current.get("NT") or {}
+        ftemps = view.ftemps
+        nt = view.nt
 
         if self._label in ftemps:
             attributes["f_temp"] = ftemps[self._label]
@@ -679,18 +623,44 @@ class PiFireProbeTempSensor(SensorEntity):
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle coordinator update."""
+        self._value = self._read_value()
+
+        # Skip the state write when nothing visible has changed
+        state = (
+            self._value,
+            self.native_unit_of_measurement,
+            self.icon,
+            self.available,
+            self.extra_state_attributes,
+        )
+        if state == self._last_state:
+            return
+        self._last_state = state
         self.async_write_ha_state()
 
 
+def _num(x: Any) -> float | None:
+    """Convert a reported temperature to float; "Unknown" reads as 0."""
+    try:
+        # Handle "Unknown" string values
+        if isinstance(x, str) and x.lower() == "unknown":
+            return 0.0
+        return float(x)
+    except (TypeError, ValueError):
+        return None
+
+
+@lru_cache(maxsize=64)
 def _pretty_probe_name(label: str) -> str:
     """Turn 'Probe1' -> 'Probe 1 Temperature', 'Grill' -> 'Grill Temperature'."""
     if label.lower() == "grill":
         return "Grill Temperature"
 
-    spaced = re.sub(r"(?<=\D)(\d+)$", r" \1", label)
+    spaced = _TRAILING_DIGITS.sub(r" \1", label)
     return f"{spaced} Temperature"
 
 
+@lru_cache(maxsize=256)
 def _slugify(s: str) -> str:
     """Convert string to slug format."""
-    return re.sub(r"[^a-z0-9_]+", "", s.lower().replace(" ", "_"))
+    return s.lower().translate(_SLUG_TABLE)